@@ -12,6 +12,7 @@ real performance comparisons.
 
 Usage:
     python demo_main.py
+    LOG_LEVEL=DEBUG python demo_main.py   # include query debug details
 
 Features:
 - Handle ANY professor query combination
@@ -25,11 +26,17 @@ import sys
 import logging
 from pathlib import Path
 
-# Configure logging
+# Configure logging (override with LOG_LEVEL, e.g. LOG_LEVEL=DEBUG)
+_requested_level = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').upper())
+if not isinstance(_requested_level, int):
+    _requested_level = logging.INFO  # unknown level name: keep the default
+# Third-party libraries (cassandra-driver, pymongo, matplotlib) stay at INFO or quieter
 logging.basicConfig(
-    level=logging.INFO,
+    level=max(_requested_level, logging.INFO),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+for _app_logger in ('__main__', 'core', 'interfaces', 'data_loaders', 'utils', 'src'):
+    logging.getLogger(_app_logger).setLevel(_requested_level)
 logger = logging.getLogger(__name__)
 
 def setup_project_paths():
@@ -5,6 +5,7 @@ from cassandra.auth import PlainTextAuthProvider
 import redis
 import logging
 from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 import time
 
 logging.basicConfig(level=logging.INFO)
@@ -224,43 +225,62 @@ class DatabaseManager:
 
         return status
 
+    def get_status_bundle(self) -> Dict[str, Any]:
+        """Get connection status and data counts in one call, fetched concurrently"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                'status': executor.submit(self.get_connection_status),
+                'counts': executor.submit(self.get_data_counts)
+            }
+            return {key: future.result() for key, future in futures.items()}
+
     def get_data_counts(self) -> Dict[str, Any]:
-        """Get record counts from all databases"""
+        """Get record counts from all databases (each database counted concurrently)"""
         counts = {}
 
-        # MongoDB counts
-        if self.mongo_db is not None:
-            try:
-                counts['mongodb'] = {}
-                for collection_name in self.mongo_db.list_collection_names():
-                    count = self.mongo_db[collection_name].count_documents({})
-                    counts['mongodb'][collection_name] = count
-            except Exception as e:
-                counts['mongodb'] = {'error': str(e)}
-
-        # Cassandra counts
-        if self.cassandra_session is not None:
-            try:
-                counts['cassandra'] = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {}
+            if self.mongo_db is not None:
+                futures['mongodb'] = executor.submit(self._get_mongodb_counts)
+            if self.cassandra_session is not None:
+                futures['cassandra'] = executor.submit(self._get_cassandra_counts)
 
-                # Get all tables in keyspace
-                tables_query = "SELECT table_name FROM system_schema.tables WHERE keyspace_name = %s"
-                tables_result = self.cassandra_session.execute(tables_query, [self.config['cassandra']['keyspace']])
+            for db, future in futures.items():
+                try:
+                    counts[db] = future.result()
+                except Exception as e:
+                    counts[db] = {'error': str(e)}
 
-                for table_row in tables_result:
-                    table_name = table_row.table_name
-                    try:
-                        # Count records (this will generate warnings for non-partitioned counts)
-                        count_query = f"SELECT COUNT(*) FROM {table_name}"
-                        count_result = self.cassandra_session.execute(count_query)
-                        count = count_result.one().count
-                        counts['cassandra'][table_name] = count
-                    except Exception as e:
-                        counts['cassandra'][table_name] = f"Error: {str(e)}"
+        return counts
 
+    def _get_mongodb_counts(self) -> Dict[str, Any]:
+        """Count documents in every MongoDB collection, one request per collection in parallel"""
+        collection_names = self.mongo_db.list_collection_names()
+        if not collection_names:
+            return {}
+
+        # estimated_document_count reads collection metadata instead of scanning
+        with ThreadPoolExecutor(max_workers=min(8, len(collection_names))) as executor:
+            futures = [executor.submit(self.mongo_db[name].estimated_document_count) for name in collection_names]
+            return {name: future.result() for name, future in zip(collection_names, futures)}
+
+    def _get_cassandra_counts(self) -> Dict[str, Any]:
+        """Count records in every Cassandra table, one table at a time"""
+        # Get all tables in keyspace
+        tables_query = "SELECT table_name FROM system_schema.tables WHERE keyspace_name = %s"
+        tables_result = self.cassandra_session.execute(tables_query, [self.config['cassandra']['keyspace']])
+        table_names = [row.table_name for row in tables_result]
+
+        # Each COUNT(*) is a full scan, so running them concurrently on one node invites read timeouts
+        counts = {}
+        for table_name in table_names:
+            try:
+                # Count records (this will generate warnings for non-partitioned counts)
+                count_query = f"SELECT COUNT(*) FROM {table_name}"
+                count_result = self.cassandra_session.execute(count_query)
+                counts[table_name] = count_result.one().count
             except Exception as e:
-                counts['cassandra'] = {'error': str(e)}
-
+                counts[table_name] = f"Error: {str(e)}"
         return counts
 
     def close_all_connections(self):
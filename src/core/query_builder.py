@@ -31,6 +31,9 @@ class QueryBuilder:
         self.db_manager = db_manager
         self.schema_inspector = schema_inspector
 
+        # database -> (schema it was built from, field index)
+        self._field_index_cache = {}
+
         # Operator mappings for different databases
         self.mongodb_operators = {
             '=': lambda field, value: {field: value},
@@ -60,41 +63,48 @@ class QueryBuilder:
 
     def find_best_table_for_field(self, field_name: str, database: str) -> Optional[str]:
         """Smart table selection - find the best table/collection for a given field"""
+        candidates = self.field_index(database).get(field_name)
+        return candidates[0] if candidates else None
 
+    def field_index(self, database: str) -> Dict[str, List[str]]:
+        """Field name -> tables/collections holding it, best candidate first"""
         if database == 'mongodb':
-            mongodb_schema = self.schema_inspector.mongodb_schema
-            for collection, info in mongodb_schema.items():
-                if 'fields' in info and field_name in info['fields']:
-                    return collection
-
+            schema = self.schema_inspector.mongodb_schema
         elif database == 'cassandra':
-            cassandra_schema = self.schema_inspector.cassandra_schema
-
-            # Priority order: partition key tables first, then main table
-            table_priority = []
-            main_table = None
+            schema = self.schema_inspector.cassandra_schema
+        else:
+            return {}
 
-            for table, info in cassandra_schema.items():
-                if 'columns' in info and field_name in info['columns']:
-                    column_info = info['columns'][field_name]
+        # Rebuilt only when the inspector has produced a new schema
+        cached = self._field_index_cache.get(database)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
 
-                    if column_info.get('is_partition_key'):
-                        # Partition key - highest priority
-                        table_priority.insert(0, table)
+        index = {}
+        if database == 'mongodb':
+            for collection, info in schema.items():
+                if isinstance(info, dict) and 'fields' in info:
+                    for field_name in info['fields']:
+                        index.setdefault(field_name, []).append(collection)
+        else:
+            # Priority order: partition key tables first, then other tables, main table last
+            partition, regular, main = {}, {}, {}
+            for table, info in schema.items():
+                if not isinstance(info, dict) or 'columns' not in info:
+                    continue
+                for col_name, col_info in info['columns'].items():
+                    if col_info.get('is_partition_key'):
+                        partition.setdefault(col_name, []).insert(0, table)
                     elif table == 'transactions':
-                        # Main table - lowest priority
-                        main_table = table
+                        main[col_name] = [table]
                     else:
-                        # Regular optimized table - medium priority
-                        table_priority.append(table)
-
-            # Add main table at the end if field exists there
-            if main_table:
-                table_priority.append(main_table)
+                        regular.setdefault(col_name, []).append(table)
 
-            return table_priority[0] if table_priority else None
+            for col_name in {**partition, **regular, **main}:
+                index[col_name] = partition.get(col_name, []) + regular.get(col_name, []) + main.get(col_name, [])
 
-        return None
+        self._field_index_cache[database] = (schema, index)
+        return index
 
     def get_all_available_fields(self, database: str) -> Dict[str, List[str]]:
         """Get all available fields organized by table/collection"""
@@ -1,12 +1,15 @@
 # src/core/statistical_performance_analyzer.py
+import os
+import sys
 import time
-import statistics
 import json
 import csv
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import logging
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +33,25 @@ class StatisticalPerformanceAnalyzer:
     and provides statistical analysis with visualization options.
     """
 
-    def __init__(self, performance_analyzer):
+    def __init__(self, performance_analyzer, use_color: Optional[bool] = None):
         self.performance_analyzer = performance_analyzer
+        # Plain text when piped to a file/log or when NO_COLOR is set (decided once)
+        if use_color is None:
+            use_color = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+        self.use_color = use_color
 
     def run_statistical_analysis(self, query_config: Dict[str, Any],
-                                run_count: int = 10) -> Dict[str, Any]:
-        """Run multiple iterations and perform statistical analysis"""
+                                run_count: int = 10, concurrency: int = 1) -> Dict[str, Any]:
+        """Run multiple iterations and perform statistical analysis
 
-        print(f"\n🔬 {self.colored_text(f'STATISTICAL PERFORMANCE ANALYSIS ({run_count} runs)', 'bold')}")
+        With concurrency > 1 the runs are submitted to a thread pool so up to
+        `concurrency` comparisons are in flight at once. Each run is still a
+        full round-trip, so per-run timings stay valid; concurrency=1 keeps the
+        original isolated sequential measurement.
+        """
+
+        mode = f", {concurrency} concurrent" if concurrency > 1 else ""
+        print(f"\n🔬 {self.colored_text(f'STATISTICAL PERFORMANCE ANALYSIS ({run_count} runs{mode})', 'bold')}")
         print("=" * 60)
 
         # Storage for results
@@ -46,53 +60,86 @@ class StatisticalPerformanceAnalyzer:
         optimized_failures = 0
         unoptimized_failures = 0
 
-        # Run multiple iterations
-        for i in range(run_count):
-            print(f"🔄 Run {i+1}/{run_count}...", end=" ", flush=True)
+        def record(comparison):
+            nonlocal optimized_failures, unoptimized_failures
+            if comparison.optimized_result.success:
+                optimized_times.append(comparison.optimized_result.execution_time_ms)
+            else:
+                optimized_failures += 1
 
-            try:
-                # Run single comparison
-                comparison = self.performance_analyzer.compare_optimization_scenarios(query_config)
+            if comparison.unoptimized_result.success:
+                unoptimized_times.append(comparison.unoptimized_result.execution_time_ms)
+            else:
+                unoptimized_failures += 1
 
-                # Record results
-                if comparison.optimized_result.success:
-                    optimized_times.append(comparison.optimized_result.execution_time_ms)
-                else:
-                    optimized_failures += 1
+        if concurrency > 1:
+            # Pipelined runs: keep up to `concurrency` comparisons in flight
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [executor.submit(self.performance_analyzer.compare_optimization_scenarios, query_config)
+                           for _ in range(run_count)]
+
+                for done, future in enumerate(as_completed(futures), 1):
+                    print(f"🔄 Run {done}/{run_count}...", end=" ", flush=True)
+                    try:
+                        record(future.result())
+                        print("✅")
+                    except Exception as e:
+                        print(f"❌ Error: {e}")
+                        optimized_failures += 1
+                        unoptimized_failures += 1
+        else:
+            # Run multiple iterations
+            for i in range(run_count):
+                print(f"🔄 Run {i+1}/{run_count}...", end=" ", flush=True)
 
-                if comparison.unoptimized_result.success:
-                    unoptimized_times.append(comparison.unoptimized_result.execution_time_ms)
-                else:
-                    unoptimized_failures += 1
+                try:
+                    # Run single comparison
+                    comparison = self.performance_analyzer.compare_optimization_scenarios(query_config)
 
-                print("✅")
+                    # Record results
+                    record(comparison)
 
-                # Small delay to avoid overwhelming the database
-                time.sleep(0.1)
+                    print("✅")
 
-            except Exception as e:
-                print(f"❌ Error: {e}")
-                optimized_failures += 1
-                unoptimized_failures += 1
+                    # Small delay to avoid overwhelming the database
+                    time.sleep(0.1)
+
+                except Exception as e:
+                    print(f"❌ Error: {e}")
+                    optimized_failures += 1
+                    unoptimized_failures += 1
+
+        # Convert timings to arrays once; statistics and charts reuse them
+        optimized_array = np.asarray(optimized_times, dtype=np.float64)
+        unoptimized_array = np.asarray(unoptimized_times, dtype=np.float64)
 
         # Calculate statistics
-        optimized_stats = self._calculate_statistics(optimized_times, run_count)
-        unoptimized_stats = self._calculate_statistics(unoptimized_times, run_count)
+        optimized_stats = self._calculate_statistics(optimized_times, run_count, optimized_array)
+        unoptimized_stats = self._calculate_statistics(unoptimized_times, run_count, unoptimized_array)
+        percentiles = {
+            'optimized': self._calculate_percentiles(optimized_array),
+            'unoptimized': self._calculate_percentiles(unoptimized_array)
+        }
 
         # Display results
-        self._display_statistical_results(optimized_stats, unoptimized_stats, query_config)
+        self._display_statistical_results(optimized_stats, unoptimized_stats, query_config, percentiles)
 
         # Return comprehensive results
         return {
             'query_config': query_config,
             'run_count': run_count,
+            'concurrency': concurrency,
             'optimized_stats': optimized_stats,
             'unoptimized_stats': unoptimized_stats,
+            'percentiles': percentiles,
+            '_np_opt': optimized_array,
+            '_np_unopt': unoptimized_array,
             'timestamp': datetime.now().isoformat(),
             'analysis': self._generate_statistical_analysis(optimized_stats, unoptimized_stats)
         }
 
-    def _calculate_statistics(self, times: List[float], total_runs: int) -> StatisticalResult:
+    def _calculate_statistics(self, times: List[float], total_runs: int,
+                              times_array: Optional[np.ndarray] = None) -> StatisticalResult:
         """Calculate comprehensive statistics for execution times"""
 
         if not times:
@@ -113,10 +160,13 @@ class StatisticalPerformanceAnalyzer:
         failed_runs = total_runs - successful_runs
         success_rate = (successful_runs / total_runs) * 100
 
-        mean_time = statistics.mean(times)
-        std_dev = statistics.stdev(times) if len(times) > 1 else 0.0
-        min_time = min(times)
-        max_time = max(times)
+        if times_array is None:
+            times_array = np.asarray(times, dtype=np.float64)
+
+        mean_time = float(times_array.mean())
+        std_dev = float(times_array.std(ddof=1)) if len(times) > 1 else 0.0
+        min_time = float(times_array.min())
+        max_time = float(times_array.max())
 
         # Calculate 95% confidence interval (approximate)
         if len(times) > 1:
@@ -138,11 +188,23 @@ class StatisticalPerformanceAnalyzer:
             confidence_interval=conf_interval
         )
 
+    def _calculate_percentiles(self, times_array: np.ndarray) -> Dict[str, float]:
+        """Calculate p50/p95/p99 latency percentiles"""
+
+        if times_array.size == 0:
+            return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+        p50, p95, p99 = np.percentile(times_array, [50, 95, 99])
+        return {'p50': float(p50), 'p95': float(p95), 'p99': float(p99)}
+
     def _display_statistical_results(self, opt_stats: StatisticalResult,
                                    unopt_stats: StatisticalResult,
-                                   query_config: Dict[str, Any]):
+                                   query_config: Dict[str, Any],
+                                   percentiles: Optional[Dict[str, Dict[str, float]]] = None):
         """Display comprehensive statistical results"""
 
+        percentiles = percentiles or {}
+
         print(f"\n📊 {self.colored_text('STATISTICAL RESULTS', 'bold')}")
         print("=" * 50)
 
@@ -152,6 +214,9 @@ class StatisticalPerformanceAnalyzer:
             print(f"   📈 Mean Time: {opt_stats.mean_time:.2f}ms ± {opt_stats.std_deviation:.2f}ms")
             print(f"   📊 Range: {opt_stats.min_time:.2f}ms - {opt_stats.max_time:.2f}ms")
             print(f"   🎯 95% Confidence: {opt_stats.confidence_interval[0]:.2f}ms - {opt_stats.confidence_interval[1]:.2f}ms")
+            if 'optimized' in percentiles:
+                pct = percentiles['optimized']
+                print(f"   📐 Percentiles: p50 {pct['p50']:.2f}ms | p95 {pct['p95']:.2f}ms | p99 {pct['p99']:.2f}ms")
             print(f"   ✅ Success Rate: {opt_stats.success_rate:.1f}% ({opt_stats.successful_runs}/{opt_stats.run_count})")
         else:
             print(f"   ❌ All runs failed ({opt_stats.failed_runs}/{opt_stats.run_count})")
@@ -162,6 +227,9 @@ class StatisticalPerformanceAnalyzer:
             print(f"   📈 Mean Time: {unopt_stats.mean_time:.2f}ms ± {unopt_stats.std_deviation:.2f}ms")
             print(f"   📊 Range: {unopt_stats.min_time:.2f}ms - {unopt_stats.max_time:.2f}ms")
             print(f"   🎯 95% Confidence: {unopt_stats.confidence_interval[0]:.2f}ms - {unopt_stats.confidence_interval[1]:.2f}ms")
+            if 'unoptimized' in percentiles:
+                pct = percentiles['unoptimized']
+                print(f"   📐 Percentiles: p50 {pct['p50']:.2f}ms | p95 {pct['p95']:.2f}ms | p99 {pct['p99']:.2f}ms")
             print(f"   ✅ Success Rate: {unopt_stats.success_rate:.1f}% ({unopt_stats.successful_runs}/{unopt_stats.run_count})")
         else:
             print(f"   ❌ All runs failed ({unopt_stats.failed_runs}/{unopt_stats.run_count})")
@@ -235,38 +303,46 @@ class StatisticalPerformanceAnalyzer:
 
     def export_results(self, results: Dict[str, Any], format_type: str = 'csv') -> str:
         """Export statistical results to various formats"""
+        return self.export_results_multi(results, [format_type])[format_type]
+
+    def export_results_multi(self, results: Dict[str, Any], formats: List[str]) -> Dict[str, str]:
+        """Export statistical results to several formats sharing one timestamp
+
+        Returns a mapping of format -> filename.
+        """
+
+        unsupported = [f for f in formats if f not in ('csv', 'json')]
+        if unsupported:
+            raise ValueError(f"Unsupported export format: {', '.join(unsupported)}")
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        files = {}
 
-        if format_type == 'csv':
-            filename = f"performance_analysis_{timestamp}.csv"
-            self._export_csv(results, filename)
-        elif format_type == 'json':
-            filename = f"performance_analysis_{timestamp}.json"
-            self._export_json(results, filename)
-        else:
-            raise ValueError(f"Unsupported export format: {format_type}")
+        if 'csv' in formats:
+            files['csv'] = f"performance_analysis_{timestamp}.csv"
+            self._export_csv(results, files['csv'])
+
+        if 'json' in formats:
+            files['json'] = f"performance_analysis_{timestamp}.json"
+            self._export_json(results, files['json'])
 
-        return filename
+        return files
 
     def _export_csv(self, results: Dict[str, Any], filename: str):
         """Export results to CSV format"""
 
+        opt_stats = results['optimized_stats']
+        unopt_stats = results['unoptimized_stats']
+
         with open(filename, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
 
             # Header
             writer.writerow(['Approach', 'Run', 'Execution_Time_ms'])
 
-            # Optimized data
-            opt_stats = results['optimized_stats']
-            for i, time_ms in enumerate(opt_stats.execution_times, 1):
-                writer.writerow(['Optimized', i, time_ms])
-
-            # Unoptimized data
-            unopt_stats = results['unoptimized_stats']
-            for i, time_ms in enumerate(unopt_stats.execution_times, 1):
-                writer.writerow(['Unoptimized', i, time_ms])
+            # Optimized and unoptimized data
+            writer.writerows(('Optimized', i, time_ms) for i, time_ms in enumerate(opt_stats.execution_times, 1))
+            writer.writerows(('Unoptimized', i, time_ms) for i, time_ms in enumerate(unopt_stats.execution_times, 1))
 
     def _export_json(self, results: Dict[str, Any], filename: str):
         """Export results to JSON format"""
@@ -300,6 +376,9 @@ class StatisticalPerformanceAnalyzer:
 
     def colored_text(self, text: str, color: str) -> str:
         """Add color to text for better terminal display"""
+        if not self.use_color:
+            return text
+
         colors = {
             'header': '\033[95m',
             'blue': '\033[94m',
@@ -1,8 +1,69 @@
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # headless rendering, also in pool workers
+from matplotlib import image, style
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+import io
 import os
+from collections import namedtuple
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+import multiprocessing
+
+# Longest series drawn point-for-point in the runs panels; longer ones are strided down
+MAX_POINTS = 500
+
+# Plain snapshot of the StatisticalResult fields the dashboard text reads
+_StatsView = namedtuple('_StatsView', 'mean std mn mx n succ')
+
+# Dashboard summary panel, filled with str.format_map (opt/unopt are _StatsView)
+_SUMMARY_TEMPLATE = """\
+🎯 PERFORMANCE ANALYSIS SUMMARY
+
+📊 Statistical Results ({opt.n} runs):
+• Mean Speedup: {speedup:.1f}x faster
+• Performance Improvement: {improvement:.1f}%
+• Average Time Saved: {time_saved:.2f}ms per query
+
+🚀 Optimized Approach:
+• Mean: {opt.mean:.2f}ms ± {opt.std:.2f}ms
+• Range: {opt.mn:.2f}ms - {opt.mx:.2f}ms
+• Success Rate: {opt.succ:.1f}%
+
+🐌 Unoptimized Approach:
+• Mean: {unopt.mean:.2f}ms ± {unopt.std:.2f}ms
+• Range: {unopt.mn:.2f}ms - {unopt.mx:.2f}ms
+• Success Rate: {unopt.succ:.1f}%
+
+💡 Recommendation: {priority} optimization for production use"""
+
+# Per-process generator used by generate_many workers
+_worker_generator = None
+
+
+def _init_worker(dpi: int, fast: bool):
+    """Create the worker's generator with the parent's output settings"""
+    global _worker_generator
+    _worker_generator = PerformanceChartGenerator(dpi=dpi, fast=fast)
+
+
+def _render_one(job: Tuple[int, Dict[str, Any], str, str]) -> Tuple[int, str]:
+    """Render a single (job_id, results, chart_type, timestamp) job in a pool worker"""
+    job_id, results, chart_type, timestamp = job
+    filename = _worker_generator._render(results, chart_type, timestamp)
+    # The pool may terminate workers as soon as results are in, so finish the write here
+    _worker_generator.flush()
+    return job_id, filename
+
+
+def _summary(opt_mean: float, unopt_mean: float) -> np.ndarray:
+    """[speedup, improvement %, time saved ms] of the optimized over the unoptimized mean"""
+    means = np.array([opt_mean, unopt_mean], dtype=np.float64)
+    saved = means[1] - means[0]
+    return np.array([means[1] / means[0], saved / means[1] * 100, saved])
+
 
 class PerformanceChartGenerator:
     """
@@ -10,103 +71,279 @@ class PerformanceChartGenerator:
     Creates publication-ready visualizations for academic demonstrations.
     """
 
-    def __init__(self):
+    def __init__(self, dpi: int = 150, fast: bool = True):
+        # Output resolution and PNG encoding: fast favours zlib speed over file size
+        self.dpi = dpi
+        self.fast = fast
+        self._png_kwargs = {'compress_level': 1} if fast else {'compress_level': 6, 'optimize': True}
+
         # Set up matplotlib for better-looking charts
-        plt.style.use('default')
-        plt.rcParams['figure.figsize'] = (12, 8)
-        plt.rcParams['font.size'] = 12
-        plt.rcParams['axes.grid'] = True
-        plt.rcParams['grid.alpha'] = 0.3
+        style.use('default')
+        matplotlib.rcParams['figure.figsize'] = (12, 8)
+        matplotlib.rcParams['font.size'] = 12
+        matplotlib.rcParams['axes.grid'] = True
+        matplotlib.rcParams['grid.alpha'] = 0.3
+
+        # Output directory, created once up front (before any pool workers start)
+        self._results_dir = "results"
+        os.makedirs(self._results_dir, exist_ok=True)
+
+        # Background PNG encoders/writers and their not yet collected futures
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+
+        # chart kind -> (figure, axes, initial subplot params), reused across renders of that kind
+        self._fig_cache: Dict[str, Tuple[Figure, tuple, Dict[str, float]]] = {}
+
+    def flush(self):
+        """Wait until every submitted chart has been written, re-raising any save error"""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self):
+        """Finish pending writes, then release the cached figures"""
+        try:
+            self.flush()
+        finally:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
+        for fig, _, _ in self._fig_cache.values():
+            fig.clear()
+        self._fig_cache.clear()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+    @staticmethod
+    def _new_figure(figsize, dpi: int) -> Figure:
+        """Create a standalone Agg figure, bypassing pyplot's figure manager"""
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        return fig
+
+    def _cached_figure(self, kind: str, figsize, layout) -> Tuple[Figure, tuple]:
+        """Return the figure and axes for a chart kind, reusing them after the first call"""
+        cached = self._fig_cache.get(kind)
+        if cached is None:
+            fig = self._new_figure(figsize, self.dpi)
+            axes = tuple(layout(fig))
+            pars = fig.subplotpars
+            initial = dict(left=pars.left, right=pars.right, bottom=pars.bottom, top=pars.top,
+                           wspace=pars.wspace, hspace=pars.hspace)
+            cached = self._fig_cache[kind] = (fig, axes, initial)
+        else:
+            fig, axes, initial = cached
+            for ax in axes:
+                ax.clear()
+            # Start tight_layout from the original geometry so output matches a fresh figure
+            fig.subplots_adjust(**initial)
+        return cached[0], cached[1]
+
+    def _save(self, fig: Figure, kind: str, timestamp: str) -> str:
+        """Draw the figure and queue its PNG write in the background; flush() before reading the file"""
+        filename = f"performance_{kind}_{timestamp}.png"
+        fig.canvas.draw()
+        # Copy: cached figures are cleared and redrawn by the next render of this kind
+        rgba = np.array(fig.canvas.buffer_rgba())
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending.append(self._io_pool.submit(
+            self._write_png, rgba, os.path.join(self._results_dir, filename)))
+        return filename
+
+    def _write_png(self, rgba: np.ndarray, filepath: str):
+        """Encode the pixels in memory, then hand the whole PNG to the filesystem in one write"""
+        buf = io.BytesIO()
+        image.imsave(buf, rgba, format='png', dpi=self.dpi, pil_kwargs=self._png_kwargs)
+        with open(filepath, 'wb') as f:
+            f.write(buf.getbuffer())
+
+    @staticmethod
+    def _box_stats(times: np.ndarray, label: str) -> Dict[str, Any]:
+        """bxp-ready box statistics: quartiles, 1.5 IQR whiskers, fliers and median notch"""
+        q1, med, q3 = np.quantile(times, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = times[(times >= q1 - 1.5 * iqr) & (times <= q3 + 1.5 * iqr)]
+        whislo = min(inside.min(), q1) if inside.size else q1
+        whishi = max(inside.max(), q3) if inside.size else q3
+        notch = 1.57 * iqr / np.sqrt(times.size)
+        return {
+            'label': label, 'med': med, 'q1': q1, 'q3': q3,
+            'whislo': whislo, 'whishi': whishi,
+            'fliers': times[(times < whislo) | (times > whishi)],
+            'cilo': med - notch, 'cihi': med + notch
+        }
+
+    @staticmethod
+    def _stats_view(stats) -> _StatsView:
+        """Read the summary fields off a StatisticalResult once"""
+        return _StatsView(stats.mean_time, stats.std_deviation, stats.min_time,
+                          stats.max_time, stats.run_count, stats.success_rate)
+
+    @staticmethod
+    def _stats_matrix(opt_stats, unopt_stats) -> np.ndarray:
+        """(2, 4) array of [mean, min, max, std] rows for optimized and unoptimized"""
+        return np.array([
+            [opt_stats.mean_time, opt_stats.min_time, opt_stats.max_time, opt_stats.std_deviation],
+            [unopt_stats.mean_time, unopt_stats.min_time, unopt_stats.max_time, unopt_stats.std_deviation]
+        ], dtype=np.float64)
+
+    @staticmethod
+    def _dashboard_layout(fig: Figure) -> tuple:
+        """Runs panel on top, box and bar panels in the middle, summary text below"""
+        gs = fig.add_gridspec(3, 2, height_ratios=[1, 1, 1], width_ratios=[1, 1])
+        return (fig.add_subplot(gs[0, :]), fig.add_subplot(gs[1, 0]),
+                fig.add_subplot(gs[1, 1]), fig.add_subplot(gs[2, :]))
 
     def generate_comparison_chart(self, results: Dict[str, Any], chart_type: str = 'line') -> str:
         """Generate comparison chart from statistical results"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = self._render(results, chart_type, timestamp)
+        # Single charts are written before returning; only batches overlap drawing and writing
+        self.flush()
+        return filename
+
+    def generate_dashboard_only(self, results: Dict[str, Any]) -> str:
+        """Generate just the comprehensive dashboard, skipping the chart-type dispatch"""
+        opt_times, unopt_times = self._times_arrays(results)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = self._create_comprehensive_dashboard(opt_times, unopt_times, results['optimized_stats'],
+                                                        results['unoptimized_stats'], timestamp)
+        self.flush()
+        return filename
+
+    def generate_many(self, jobs: List[Tuple[Dict[str, Any], str]], processes: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Render (results, chart_type) jobs in worker processes, returning (job_id, filename) pairs"""
+        if not jobs:
+            return []
+
+        # Job ids keep filenames unique when several jobs share a chart type
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        tasks = [(job_id, results, chart_type, f"{timestamp}_{job_id}")
+                 for job_id, (results, chart_type) in enumerate(jobs)]
+
+        processes = min(processes or os.cpu_count() or 1, len(tasks))
+        if processes == 1:
+            rendered = [(job_id, self._render(results, chart_type, stamp))
+                        for job_id, results, chart_type, stamp in tasks]
+            self.flush()
+            return rendered
+
+        # Spawned workers: forking a process with live driver threads can deadlock
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(processes, initializer=_init_worker, initargs=(self.dpi, self.fast)) as pool:
+            rendered = list(pool.imap_unordered(_render_one, tasks))
+        return sorted(rendered)
+
+    def _render(self, results: Dict[str, Any], chart_type: str, timestamp: str) -> str:
+        """Dispatch one chart type and return the saved filename"""
 
         opt_stats = results['optimized_stats']
         unopt_stats = results['unoptimized_stats']
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        opt_times, unopt_times = self._times_arrays(results)
 
         if chart_type == 'line':
-            filename = self._create_line_chart(opt_stats, unopt_stats, timestamp)
+            filename = self._create_line_chart(opt_times, unopt_times, opt_stats, unopt_stats, timestamp)
         elif chart_type == 'box':
-            filename = self._create_box_plot(opt_stats, unopt_stats, timestamp)
+            filename = self._create_box_plot(opt_times, unopt_times, opt_stats, unopt_stats, timestamp)
         elif chart_type == 'bar':
             filename = self._create_bar_chart(opt_stats, unopt_stats, timestamp)
         else:
-            filename = self._create_comprehensive_dashboard(opt_stats, unopt_stats, timestamp)
+            filename = self._create_comprehensive_dashboard(opt_times, unopt_times, opt_stats, unopt_stats, timestamp)
 
         return filename
 
-    def _create_line_chart(self, opt_stats, unopt_stats, timestamp: str) -> str:
+    @staticmethod
+    def _times_arrays(results: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Execution times as float64 arrays, reusing the analyzer's arrays when present"""
+        arrays = []
+        for array_key, stats_key in (('_np_opt', 'optimized_stats'), ('_np_unopt', 'unoptimized_stats')):
+            times = results.get(array_key)
+            if times is None:
+                times = results[stats_key].execution_times
+            arrays.append(np.asarray(times, dtype=np.float64))
+        return arrays[0], arrays[1]
+
+    @staticmethod
+    def _plot_runs_panel(ax, series: List[Tuple[np.ndarray, str, str]], rasterize_markers: bool = False):
+        """Plot (times, color, label) series against one shared run-number axis"""
+        runs = np.arange(1, max(times.size for times, _, _ in series) + 1)
+        for times, color, label in series:
+            if not times.size:
+                continue
+            series_runs = runs[:times.size]
+            if times.size > MAX_POINTS:
+                # Evenly spaced subset (first and last run kept); stats still use the full series
+                idx = np.linspace(0, times.size - 1, MAX_POINTS).astype(np.intp)
+                series_runs, times = series_runs[idx], times[idx]
+            if rasterize_markers:
+                ax.plot(series_runs, times, f'{color}-', linewidth=2)
+                ax.scatter(series_runs, times, s=16, c=color, rasterized=True, zorder=3)
+                # Empty line-with-marker proxy keeps the legend entry as it was before rasterizing
+                ax.plot([], [], f'{color}-o', linewidth=2, markersize=4, label=label)
+            else:
+                ax.plot(series_runs, times, f'{color}-o', linewidth=2, markersize=4, label=label)
+        ax.set_xlabel('Run Number')
+        ax.set_ylabel('Execution Time (ms)')
+
+    def _create_line_chart(self, opt_times: np.ndarray, unopt_times: np.ndarray,
+                           opt_stats, unopt_stats, timestamp: str) -> str:
         """Create line chart showing performance over runs"""
 
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+        fig, (ax1, ax2) = self._cached_figure('line', (12, 10), lambda f: f.subplots(2, 1))
 
         # Optimized performance line
-        if opt_stats.execution_times:
-            runs = range(1, len(opt_stats.execution_times) + 1)
-            ax1.plot(runs, opt_stats.execution_times, 'g-o', linewidth=2, markersize=4, label='Optimized')
+        self._plot_runs_panel(ax1, [(opt_times, 'g', 'Optimized')])
+        if opt_times.size:
+            lo, hi = opt_stats.confidence_interval
             ax1.axhline(y=opt_stats.mean_time, color='g', linestyle='--', alpha=0.7, label=f'Mean: {opt_stats.mean_time:.2f}ms')
-            ax1.fill_between(runs,
-                           [opt_stats.confidence_interval[0]] * len(runs),
-                           [opt_stats.confidence_interval[1]] * len(runs),
-                           alpha=0.2, color='green', label='95% Confidence')
+            ax1.axhspan(lo, hi, alpha=0.2, color='green', label='95% Confidence')
 
         ax1.set_title('🚀 Optimized Query Performance Over Time', fontsize=14, fontweight='bold')
-        ax1.set_xlabel('Run Number')
-        ax1.set_ylabel('Execution Time (ms)')
         ax1.legend()
         ax1.grid(True, alpha=0.3)
 
         # Unoptimized performance line
-        if unopt_stats.execution_times:
-            runs = range(1, len(unopt_stats.execution_times) + 1)
-            ax2.plot(runs, unopt_stats.execution_times, 'r-o', linewidth=2, markersize=4, label='Unoptimized')
+        self._plot_runs_panel(ax2, [(unopt_times, 'r', 'Unoptimized')])
+        if unopt_times.size:
+            lo, hi = unopt_stats.confidence_interval
             ax2.axhline(y=unopt_stats.mean_time, color='r', linestyle='--', alpha=0.7, label=f'Mean: {unopt_stats.mean_time:.2f}ms')
-            ax2.fill_between(runs,
-                           [unopt_stats.confidence_interval[0]] * len(runs),
-                           [unopt_stats.confidence_interval[1]] * len(runs),
-                           alpha=0.2, color='red', label='95% Confidence')
+            ax2.axhspan(lo, hi, alpha=0.2, color='red', label='95% Confidence')
 
         ax2.set_title('🐌 Unoptimized Query Performance Over Time', fontsize=14, fontweight='bold')
-        ax2.set_xlabel('Run Number')
-        ax2.set_ylabel('Execution Time (ms)')
         ax2.legend()
         ax2.grid(True, alpha=0.3)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
-        # Create results directory if it doesn't exist
-        results_dir = "results"
-        os.makedirs(results_dir, exist_ok=True)
+        return self._save(fig, 'line_chart', timestamp)
 
-        filename = f"performance_line_chart_{timestamp}.png"
-        filepath = os.path.join(results_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        return filename
-
-    def _create_box_plot(self, opt_stats, unopt_stats, timestamp: str) -> str:
+    def _create_box_plot(self, opt_times: np.ndarray, unopt_times: np.ndarray,
+                         opt_stats, unopt_stats, timestamp: str) -> str:
         """Create box plot comparing distributions"""
 
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, (ax,) = self._cached_figure('box', (10, 8), lambda f: [f.add_subplot(111)])
 
-        data = []
-        labels = []
+        box_stats = []
         colors = []
 
-        if opt_stats.execution_times:
-            data.append(opt_stats.execution_times)
-            labels.append('Optimized\n🚀')
+        if opt_times.size:
+            box_stats.append(self._box_stats(opt_times, 'Optimized\n🚀'))
             colors.append('lightgreen')
 
-        if unopt_stats.execution_times:
-            data.append(unopt_stats.execution_times)
-            labels.append('Unoptimized\n🐌')
+        if unopt_times.size:
+            box_stats.append(self._box_stats(unopt_times, 'Unoptimized\n🐌'))
             colors.append('lightcoral')
 
-        if data:
-            bp = ax.boxplot(data, labels=labels, patch_artist=True, notch=True)
+        if box_stats:
+            bp = ax.bxp(box_stats, patch_artist=True, shownotches=True)
 
             # Color the boxes
             for patch, color in zip(bp['boxes'], colors):
@@ -118,9 +355,8 @@ class PerformanceChartGenerator:
         ax.grid(True, alpha=0.3)
 
         # Add statistics text
-        if opt_stats.execution_times and unopt_stats.execution_times:
-            speedup = unopt_stats.mean_time / opt_stats.mean_time
-            improvement = ((unopt_stats.mean_time - opt_stats.mean_time) / unopt_stats.mean_time) * 100
+        if opt_times.size and unopt_times.size:
+            speedup, improvement, _ = _summary(opt_stats.mean_time, unopt_stats.mean_time)
 
             stats_text = f"""
 📈 Performance Summary:
@@ -133,33 +369,23 @@ class PerformanceChartGenerator:
             ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
                    verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
 
-        plt.tight_layout()
-
-        # Create results directory if it doesn't exist
-        results_dir = "results"
-        os.makedirs(results_dir, exist_ok=True)
+        fig.tight_layout()
 
-        filename = f"performance_box_plot_{timestamp}.png"
-        filepath = os.path.join(results_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        return filename
+        return self._save(fig, 'box_plot', timestamp)
 
     def _create_bar_chart(self, opt_stats, unopt_stats, timestamp: str) -> str:
         """Create bar chart of summary statistics"""
 
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, (ax,) = self._cached_figure('bar', (12, 8), lambda f: [f.add_subplot(111)])
 
         categories = ['Mean Time', 'Min Time', 'Max Time', 'Std Deviation']
-        optimized_values = [opt_stats.mean_time, opt_stats.min_time, opt_stats.max_time, opt_stats.std_deviation]
-        unoptimized_values = [unopt_stats.mean_time, unopt_stats.min_time, unopt_stats.max_time, unopt_stats.std_deviation]
+        stats = self._stats_matrix(opt_stats, unopt_stats)
 
         x = np.arange(len(categories))
         width = 0.35
 
-        bars1 = ax.bar(x - width/2, optimized_values, width, label='Optimized 🚀', color='lightgreen', alpha=0.8)
-        bars2 = ax.bar(x + width/2, unoptimized_values, width, label='Unoptimized 🐌', color='lightcoral', alpha=0.8)
+        bars1 = ax.bar(x - width/2, stats[0], width, label='Optimized 🚀', color='lightgreen', alpha=0.8)
+        bars2 = ax.bar(x + width/2, stats[1], width, label='Unoptimized 🐌', color='lightcoral', alpha=0.8)
 
         ax.set_title('📊 Performance Statistics Comparison', fontsize=16, fontweight='bold')
         ax.set_ylabel('Time (ms)')
@@ -170,71 +396,35 @@ class PerformanceChartGenerator:
         ax.grid(True, alpha=0.3)
 
         # Add value labels on bars
-        def add_value_labels(bars):
-            for bar in bars:
-                height = bar.get_height()
-                ax.annotate(f'{height:.2f}',
-                           xy=(bar.get_x() + bar.get_width() / 2, height),
-                           xytext=(0, 3),  # 3 points vertical offset
-                           textcoords="offset points",
-                           ha='center', va='bottom', fontsize=10)
-
-        add_value_labels(bars1)
-        add_value_labels(bars2)
+        ax.bar_label(bars1, fmt='%.2f', padding=3, fontsize=10)
+        ax.bar_label(bars2, fmt='%.2f', padding=3, fontsize=10)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
-        # Create results directory if it doesn't exist
-        results_dir = "results"
-        os.makedirs(results_dir, exist_ok=True)
+        return self._save(fig, 'bar_chart', timestamp)
 
-        filename = f"performance_bar_chart_{timestamp}.png"
-        filepath = os.path.join(results_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        return filename
-
-    def _create_comprehensive_dashboard(self, opt_stats, unopt_stats, timestamp: str) -> str:
+    def _create_comprehensive_dashboard(self, opt_times: np.ndarray, unopt_times: np.ndarray,
+                                        opt_stats, unopt_stats, timestamp: str) -> str:
         """Create comprehensive dashboard with multiple visualizations"""
 
-        fig = plt.figure(figsize=(16, 12))
-
-        # Create subplots
-        gs = fig.add_gridspec(3, 2, height_ratios=[1, 1, 1], width_ratios=[1, 1])
+        fig, (ax1, ax2, ax3, ax4) = self._cached_figure('dashboard', (16, 12), self._dashboard_layout)
 
         # 1. Line plot of performance over time
-        ax1 = fig.add_subplot(gs[0, :])
-        if opt_stats.execution_times and unopt_stats.execution_times:
-            runs = range(1, max(len(opt_stats.execution_times), len(unopt_stats.execution_times)) + 1)
-
-            if opt_stats.execution_times:
-                ax1.plot(range(1, len(opt_stats.execution_times) + 1), opt_stats.execution_times,
-                        'g-o', linewidth=2, markersize=4, label='Optimized 🚀')
-
-            if unopt_stats.execution_times:
-                ax1.plot(range(1, len(unopt_stats.execution_times) + 1), unopt_stats.execution_times,
-                        'r-o', linewidth=2, markersize=4, label='Unoptimized 🐌')
-
+        self._plot_runs_panel(ax1, [(opt_times, 'g', 'Optimized 🚀'), (unopt_times, 'r', 'Unoptimized 🐌')],
+                              rasterize_markers=True)
         ax1.set_title('Performance Over Time', fontweight='bold')
-        ax1.set_xlabel('Run Number')
-        ax1.set_ylabel('Execution Time (ms)')
         ax1.legend()
         ax1.grid(True, alpha=0.3)
 
         # 2. Box plot comparison
-        ax2 = fig.add_subplot(gs[1, 0])
-        data = []
-        labels = []
-        if opt_stats.execution_times:
-            data.append(opt_stats.execution_times)
-            labels.append('Optimized')
-        if unopt_stats.execution_times:
-            data.append(unopt_stats.execution_times)
-            labels.append('Unoptimized')
-
-        if data:
-            bp = ax2.boxplot(data, labels=labels, patch_artist=True)
+        box_stats = []
+        if opt_times.size:
+            box_stats.append(self._box_stats(opt_times, 'Optimized'))
+        if unopt_times.size:
+            box_stats.append(self._box_stats(unopt_times, 'Unoptimized'))
+
+        if box_stats:
+            bp = ax2.bxp(box_stats, patch_artist=True)
             colors = ['lightgreen', 'lightcoral']
             for patch, color in zip(bp['boxes'], colors[:len(bp['boxes'])]):
                 patch.set_facecolor(color)
@@ -245,15 +435,13 @@ class PerformanceChartGenerator:
         ax2.grid(True, alpha=0.3)
 
         # 3. Bar chart of statistics
-        ax3 = fig.add_subplot(gs[1, 1])
         categories = ['Mean', 'Min', 'Max', 'Std Dev']
-        opt_values = [opt_stats.mean_time, opt_stats.min_time, opt_stats.max_time, opt_stats.std_deviation]
-        unopt_values = [unopt_stats.mean_time, unopt_stats.min_time, unopt_stats.max_time, unopt_stats.std_deviation]
+        stats = self._stats_matrix(opt_stats, unopt_stats)
 
         x = np.arange(len(categories))
         width = 0.35
-        ax3.bar(x - width/2, opt_values, width, label='Optimized', color='lightgreen', alpha=0.8)
-        ax3.bar(x + width/2, unopt_values, width, label='Unoptimized', color='lightcoral', alpha=0.8)
+        ax3.bar(x - width/2, stats[0], width, label='Optimized', color='lightgreen', alpha=0.8)
+        ax3.bar(x + width/2, stats[1], width, label='Unoptimized', color='lightcoral', alpha=0.8)
 
         ax3.set_title('Statistics Summary', fontweight='bold')
         ax3.set_ylabel('Time (ms)')
@@ -263,49 +451,27 @@ class PerformanceChartGenerator:
         ax3.grid(True, alpha=0.3)
 
         # 4. Summary statistics text
-        ax4 = fig.add_subplot(gs[2, :])
         ax4.axis('off')
 
-        if opt_stats.execution_times and unopt_stats.execution_times:
-            speedup = unopt_stats.mean_time / opt_stats.mean_time
-            improvement = ((unopt_stats.mean_time - opt_stats.mean_time) / unopt_stats.mean_time) * 100
-            time_saved = unopt_stats.mean_time - opt_stats.mean_time
-
-            summary_text = f"""
-🎯 PERFORMANCE ANALYSIS SUMMARY
-
-📊 Statistical Results ({opt_stats.run_count} runs):
-• Mean Speedup: {speedup:.1f}x faster
-• Performance Improvement: {improvement:.1f}%
-• Average Time Saved: {time_saved:.2f}ms per query
-
-🚀 Optimized Approach:
-• Mean: {opt_stats.mean_time:.2f}ms ± {opt_stats.std_deviation:.2f}ms
-• Range: {opt_stats.min_time:.2f}ms - {opt_stats.max_time:.2f}ms
-• Success Rate: {opt_stats.success_rate:.1f}%
-
-🐌 Unoptimized Approach:
-• Mean: {unopt_stats.mean_time:.2f}ms ± {unopt_stats.std_deviation:.2f}ms
-• Range: {unopt_stats.min_time:.2f}ms - {unopt_stats.max_time:.2f}ms
-• Success Rate: {unopt_stats.success_rate:.1f}%
-
-💡 Recommendation: {'High Priority' if speedup > 10 else 'Recommended' if speedup > 2 else 'Optional'} optimization for production use
-            """
-
-            ax4.text(0.05, 0.95, summary_text, transform=ax4.transAxes, fontsize=11,
-                    verticalalignment='top', fontfamily='monospace',
+        if opt_times.size and unopt_times.size:
+            opt_v = self._stats_view(opt_stats)
+            unopt_v = self._stats_view(unopt_stats)
+            speedup, improvement, time_saved = _summary(opt_v.mean, unopt_v.mean)
+
+            summary_text = _SUMMARY_TEMPLATE.format_map({
+                'opt': opt_v,
+                'unopt': unopt_v,
+                'speedup': speedup,
+                'improvement': improvement,
+                'time_saved': time_saved,
+                'priority': 'High Priority' if speedup > 10 else 'Recommended' if speedup > 2 else 'Optional'
+            })
+
+            ax4.text(0.05, 0.5, summary_text, transform=ax4.transAxes, fontsize=11,
+                    verticalalignment='center', fontfamily='monospace',
                     bbox=dict(boxstyle='round,pad=1', facecolor='lightblue', alpha=0.8))
 
-        plt.suptitle('🔬 Kedai Kopi Performance Analysis Dashboard', fontsize=18, fontweight='bold')
-        plt.tight_layout()
-
-        # Create results directory if it doesn't exist
-        results_dir = "results"
-        os.makedirs(results_dir, exist_ok=True)
+        fig.suptitle('🔬 Kedai Kopi Performance Analysis Dashboard', fontsize=18, fontweight='bold')
+        fig.tight_layout()
 
-        filename = f"performance_dashboard_{timestamp}.png"
-        filepath = os.path.join(results_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        return filename
+        return self._save(fig, 'dashboard', timestamp)